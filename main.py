@@ -1,27 +1,165 @@
 import asyncio
+import functools
+import hashlib
+import json
 import multiprocessing
-
-# Bizarrely, this needs to be up here for native mode, don't move it
-multiprocessing.set_start_method("spawn", force=True)
+import os
 import platform
+
+# Bizarrely, this needs to be up here for native mode, don't move it.
+# Native mode is only used on Windows, other platforms keep their default start method.
+if platform.system() == "Windows":
+    multiprocessing.set_start_method("spawn", force=True)
+import random
 import re
 import time
-from datetime import date, datetime
-from os import getenv
-from typing import Any, Callable, Optional
+from datetime import UTC, date, datetime
+from email.utils import parsedate_to_datetime
+from itertools import chain, islice
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
 
 import asana
 import keyring
+import urllib3
 from asana.rest import ApiException
 from dotenv import load_dotenv
-from nicegui import native, ui
+from nicegui import app, background_tasks, native, ui
 from nicegui.element import Element
 
-# Load variables from .env
-load_dotenv()
+# Patterns used while filtering, compiled once instead of on every project.
+# Holds are matched case-insensitively, so "Hold 12/31 AJP" hides a project just like "hold 12/31 AJP".
+_HOLD_RE = re.compile(
+    r"(?:.*?\s)?hold\s+(\d{1,2}/\d{1,2}(?:/\d{2,4})?)\s+[/]*(\w+)[/]*",  # hold 01/31/24 JS | hold 01/31 AJP
+    re.IGNORECASE,
+)
+_IFSP_RE = re.compile(r"\bIFSP\b", re.IGNORECASE)
+# Dates like 3/15, 3.15 or 3-15/25, separators are explicit since '.' also matched runs of digits like 12345
+_DATE_IN_NAME_RE = re.compile(r"\d{1,2}[./-]\d{1,2}(?:[./-]\d{1,4})?")
+
+
+# Statuses worth retrying, rate limits, server errors and calls that timed out (see AsanaClient._call_api)
+_RETRYABLE_STATUSES = frozenset((408, 429, 500, 502, 503, 504))
+
+
+def _retry_delay(e: Exception, attempt: int, cap: float = 60) -> float:
+    """Get how long to wait before retrying a failed request.
+
+    Uses Asana's Retry-After header if present (in seconds or as an HTTP date), otherwise exponential backoff with
+    full jitter, so clients sharing a quota don't all retry at the same moment.
+    """
+    retry_after = (getattr(e, "headers", None) or {}).get("Retry-After")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+    return random.uniform(0, min(cap, 2**attempt))
+
+
+def _user_cache_dir() -> Path:
+    """Get this tool's cache directory for the current user, in the usual place for the platform"""
+    system = platform.system()
+    if system == "Windows":
+        base = Path(os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif system == "Darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "asana-tool"
+
+
+def _write_private_file(path: Path, text: str) -> None:
+    """Replace a file with text only the current user can read, so a reader never sees it half written"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    with open(
+        os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600),
+        "w",
+        encoding="utf-8",
+    ) as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_hold_date(date_str: str, current_year: int) -> date | None:
+    """Parse the date of a hold, cached since the same dates come up across many projects' notes.
+
+    Args:
+        date_str (str): Date from a hold entry, as MM/DD, MM/DD/YY or MM/DD/YYYY.
+        current_year (int): Year for dates without one, part of the cache key so it's right after new year.
+
+    Returns:
+        date | None: The date, or None if it isn't a date with slashes.
+
+    Raises:
+        ValueError: If the date is not valid.
+    """
+    # Handle different date formats
+    if "/" not in date_str:
+        return None
+    if date_str.count("/") == 1:
+        return datetime.strptime(date_str, "%m/%d").replace(year=current_year).date()
+    # Handle 2 or 4 digit years
+    try:
+        return datetime.strptime(date_str, "%m/%d/%Y").date()
+    except ValueError:
+        return datetime.strptime(date_str, "%m/%d/%y").date()
 
 
 class AsanaClient:
+    # Every attribute is set in __init__, listed here so instances don't carry a __dict__ and lookups are direct
+    __slots__ = (
+        "_api_client",
+        "_api_semaphore",
+        "_button_classes",
+        "_circuit",
+        "_config_user_sets",
+        "_creation_rank",
+        "_fetch_listeners",
+        "_fetched_pages",
+        "_filter_cache",
+        "_held_count",
+        "_inflight_fetch",
+        "_internal_color_by_key",
+        "_list_buttons",
+        "_missing_config",
+        "_note_locks",
+        "_page_listeners",
+        "_positions_by_color",
+        "_positions_by_color_created",
+        "_positions_by_created",
+        "_prefetches",
+        "_project_by_gid",
+        "_rate_bucket",
+        "_review_buttons",
+        "_today",
+        "_used_internal_colors",
+        "_users_with_custom_views",
+        "_visible_buttons",
+        "cache_duration",
+        "cached_projects",
+        "circuit_failure_threshold",
+        "colors",
+        "config",
+        "fetch_error",
+        "last_fetch_time",
+        "max_delta_fetches",
+        "max_retries",
+        "page_configs",
+        "projects_api",
+        "request_burst",
+        "request_timeout",
+        "requests_per_minute",
+        "users_api",
+    )
+
     def __init__(self) -> None:
         # Information edited in the settings menu
         self.config: dict[str, Optional[str]] = {
@@ -30,12 +168,65 @@ class AsanaClient:
             "initials": None,
         }
         # Add projects and users API variables to store in later
+        self._api_client = None
         self.projects_api = None
         self.users_api = None
         # Add cache to store in later
         self.cached_projects = None
         self.last_fetch_time = None
         self.cache_duration = 300  # 5 minutes
+        # Attempts at each API call, and at listing all projects, before giving up on rate limits or server errors
+        self.max_retries = 3
+        # Cached projects by GID, used to only re-fetch projects that have been modified
+        self._project_by_gid: dict[str, dict] = {}
+        # Positions of cached projects by internal color, and how many are on hold, for filtering by color.
+        # The same positions are also kept in order of creation, so sorted views don't need sorting on every render.
+        self._positions_by_color: dict[str, list[int]] = {}
+        self._positions_by_created: list[int] = []
+        self._positions_by_color_created: dict[str, list[int]] = {}
+        self._creation_rank: list[int] = []
+        self._held_count = 0
+        # Results of filtering the cached projects, by filter, cleared whenever the cache or its annotations change
+        self._filter_cache: dict[tuple, tuple[list[dict], int]] = {}
+        # Above this many modified projects, a full fetch is cheaper than fetching each one
+        self.max_delta_fetches = 20
+        # Circuit breaker, so an Asana outage makes calls fail fast instead of piling more requests onto it.
+        # After circuit_failure_threshold consecutive server errors calls are blocked for a cool-off period
+        # that doubles each time the circuit opens, then a single call is let through to probe for recovery.
+        self._circuit = {
+            "state": "closed",
+            "failures": 0,
+            "opens": 0,
+            "opened_at": 0.0,
+            "probe_at": 0.0,
+        }
+        self.circuit_failure_threshold = 5
+        # Fetch of all projects currently running, shared by everything that asks for projects meanwhile
+        self._inflight_fetch: asyncio.Task | None = None
+        # Pages received so far by that fetch's current attempt, and who to pass further pages to as they arrive,
+        # with the GIDs each has been sent so a retried attempt doesn't send the same projects again
+        self._fetched_pages: list[list[dict]] = []
+        self._page_listeners: list[tuple[Callable[[list[dict]], None], set[str]]] = []
+        # Called after every successful fetch of all projects, so pages can show the new age of the data straight away
+        self._fetch_listeners: list[Callable[[], None]] = []
+        # Limit on API calls in flight at once, Asana allows 50 concurrent reads but only 15 concurrent writes
+        self._api_semaphore = asyncio.Semaphore(15)
+        # Seconds before giving up on a call, so a stalled connection doesn't leave pages loading forever.
+        # Passed to the SDK so the socket itself times out, rather than only the wait for its worker thread.
+        self.request_timeout = 10
+        # Why the last fetch of all projects failed, shown to the user, or None if it succeeded
+        self.fetch_error: str | None = None
+        # Token bucket keeping requests under Asana's rate limit of 1500 a minute on paid plans, allowing short bursts.
+        # A 429 pauses the bucket for as long as Asana asks, instead of every queued call being rejected too.
+        self.requests_per_minute = 1500
+        self.request_burst = 50
+        self._rate_bucket = {"tokens": 50.0, "updated": 0.0, "paused_until": 0.0}
+        # One lock per project, so notes added at the same time don't overwrite each other
+        self._note_locks: dict[str, asyncio.Lock] = {}
+        # Refreshes of single cached projects about to be reviewed, by GID, cleared with each full fetch
+        self._prefetches: dict[str, asyncio.Task] = {}
+        # Today's date and how it's written at the start of notes, formatted again once the day changes
+        self._today: tuple[date, str] | None = None
         # Dict of colors, their internal name, and hex code
         self.colors = {
             "purple": {
@@ -137,50 +328,192 @@ class AsanaClient:
                 "is_other": True,
             },
         }
+        # Internal color names by external name, and colors claimed by any page other than 'other'
+        self._internal_color_by_key = {
+            key: color["name"] for key, color in self.colors.items()
+        }
+        self._used_internal_colors = frozenset(
+            self._internal_color_by_key[color]
+            for config in self.page_configs.values()
+            if not config.get("is_other")
+            for color in config.get("colors", [])
+        )
+        # Configs that have list and review buttons on the root page, in display order
+        self._list_buttons = [
+            (key, config)
+            for key, config in self.page_configs.items()
+            if "list" in config.get("types", [])
+        ]
+        self._review_buttons = [
+            (key, config)
+            for key, config in self.page_configs.items()
+            if "review" in config.get("types", [])
+        ]
+        # Button classes for each page's colors and each single color, a background of one color or a gradient of the first two
+        self._button_classes: dict[tuple[str, ...], str] = {}
+        for colors in chain(
+            (tuple(config["colors"]) for config in self.page_configs.values()),
+            ((color,) for color in self.colors),
+        ):
+            if len(colors) > 1:
+                self._button_classes[colors] = (
+                    f"!bg-gradient-to-r from-[{self.colors[colors[0]]['color']}] "
+                    f"to-[{self.colors[colors[1]]['color']}] !text-black"
+                )
+            elif colors:
+                self._button_classes[colors] = (
+                    f"!bg-[{self.colors[colors[0]]['color']}] !text-black"
+                )
+        # Users that have buttons set aside for them, and the users of each config, for quick lookups when rendering
+        self._users_with_custom_views = frozenset(
+            user
+            for config in self.page_configs.values()
+            for user in config.get("users", [])
+        )
+        self._config_user_sets = {
+            key: frozenset(config.get("users", []))
+            for key, config in self.page_configs.items()
+        }
+        # List and review buttons each user sees, filled in on first use since initials can change
+        self._visible_buttons: dict[
+            str | None, tuple[list[tuple[str, dict]], list[tuple[str, dict]]]
+        ] = {}
         self._load_config()
 
     def _load_config(self) -> None:
         """Load configuration from environment variables or system keyring"""
         for key in self.config:
-            self.config[key] = getenv(f"ASANA_{key.upper()}") or keyring.get_password(
-                "asana", key
-            )
+            self.config[key] = os.getenv(f"ASANA_{key.upper()}")
+        # Only go to the keyring for values not set in the environment, it can be slow or prompt the user
+        not_in_env = [key for key, value in self.config.items() if not value]
+        for key in not_in_env:
+            self.config[key] = keyring.get_password("asana", key)
+        # Track which values are still missing, so is_configured doesn't need to check them all
+        self._missing_config = {key for key, value in self.config.items() if not value}
 
         # If we have all the config values, initialize API clients
-        if all(self.config.values()):
+        if self.is_configured:
             self._init_asana()
 
     def _init_asana(self) -> None:
         """Initialize Asana API clients"""
         configuration = asana.Configuration()
         configuration.access_token = self.config["token"]  # type: ignore
-        self.projects_api = asana.ProjectsApi(asana.ApiClient(configuration))
-        self.users_api = asana.UsersApi(asana.ApiClient(configuration))
+        # Keep enough pooled keep-alive connections for every call _call_api allows in flight,
+        # without shrinking the SDK's default of 5 per CPU on machines where that's larger
+        configuration.connection_pool_maxsize = max(
+            20, configuration.connection_pool_maxsize
+        )
+        # Share one client, and so one connection pool, between all APIs
+        self._api_client = asana.ApiClient(configuration)
+        self.projects_api = asana.ProjectsApi(self._api_client)
+        self.users_api = asana.UsersApi(self._api_client)
 
-    def save_config(self, key: str, value: str) -> None:
-        """Save configuration to system keyring and update API clients"""
+    async def save_configs(self, values: dict[str, str]) -> None:
+        """Save several configuration values to system keyring, then update API clients once for all of them"""
         # Always uppercase initials
-        if key == "initials":
-            value = value.upper()
-        # Set in keyring
-        keyring.set_password("asana", key, value)
-        # Set in memory
-        self.config[key] = value
-        # Re-init if all values are now present
-        if all(self.config.values()):
+        if "initials" in values:
+            values = {**values, "initials": values["initials"].upper()}
+        changed = {
+            key: value for key, value in values.items() if value != self.config.get(key)
+        }
+        # Set in keyring, in worker threads since the OS keychain can be slow to respond
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(keyring.set_password, "asana", key, value)
+                for key, value in changed.items()
+            )
+        )
+        for key, value in changed.items():
+            # Set in memory
+            self.config[key] = value
+            if value:
+                self._missing_config.discard(key)
+            else:
+                self._missing_config.add(key)
+        # Projects from another account or workspace mustn't be shown, even while they're fresh
+        if "token" in changed or "workspace" in changed:
+            self.cached_projects = None
+            self.last_fetch_time = None
+            self._index_projects([])
+            self._held_count = 0
+            self.fetch_error = None
+            # Detach a fetch running for the old account, so it's neither joined nor cached, see _do_fetch.
+            # It isn't cancelled, since pages awaiting it would get CancelledError rather than projects.
+            self._inflight_fetch = None
+            self._fetched_pages = []
+            self._page_listeners = []
+        # Holds are per user, so cached hold checks are stale once initials change
+        if "initials" in changed and self.cached_projects:
+            self._annotate_projects(self.cached_projects)
+        # Re-init if all values are now present, the API clients only depend on the token
+        if self.is_configured and ("token" in changed or not self.projects_api):
             self._init_asana()
 
+    def visible_buttons(
+        self, user_initials: str | None
+    ) -> tuple[list[tuple[str, dict]], list[tuple[str, dict]]]:
+        """Get the list and review buttons to show a user, only the ones set aside for them if there are any.
+
+        Args:
+            user_initials (str | None): Initials of the user.
+
+        Returns:
+            tuple[list[tuple[str, dict]], list[tuple[str, dict]]]: Keys and configs of the list buttons and review buttons.
+        """
+        visible = self._visible_buttons.get(user_initials)
+        if visible is None:
+            if user_initials in self._users_with_custom_views:
+                visible = (
+                    [
+                        (key, config)
+                        for key, config in self._list_buttons
+                        if user_initials in self._config_user_sets[key]
+                    ],
+                    [
+                        (key, config)
+                        for key, config in self._review_buttons
+                        if user_initials in self._config_user_sets[key]
+                    ],
+                )
+            else:
+                visible = (self._list_buttons, self._review_buttons)
+            self._visible_buttons[user_initials] = visible
+        return visible
+
+    def button_classes(self, colors: list[str] | tuple[str, ...]) -> str:
+        """Get the classes for a button of the given colors, using external names.
+
+        Args:
+            colors (list[str] | tuple[str, ...]): Colors of a page config, or a single color.
+
+        Returns:
+            str: Classes for a background of the color, or a gradient of the first two colors.
+        """
+        return self._button_classes[tuple(colors)]
+
     @property
     def is_configured(self) -> bool:
         """Check if all required configuration is present"""
-        return all(self.config.values())
+        return not self._missing_config
 
     async def fetch_projects(
         self,
-        opt_fields="name,color,permalink_url,notes,created_at,default_access_level,members",
+        opt_fields="name,color,permalink_url,notes,created_at,modified_at",
         force=False,
+        on_page: Callable[[list[dict]], None] | None = None,
     ) -> list[dict] | None:
-        """Get either cached or new projects from Asana API if timeout has elapsed"""
+        """Get either cached or new projects from Asana API if timeout has elapsed.
+
+        Once the cache is stale it's still returned straight away, while fresh projects are fetched in the background.
+        Only the first fetch, or a forced one, waits for Asana.
+
+        Args:
+            opt_fields (str, optional): Fields to request for each project.
+            force (bool, optional): Whether to fetch even if the cache is still fresh. Defaults to False.
+            on_page (Callable[[list[dict]], None] | None, optional): Called with each page of projects as it arrives
+                during a full fetch, so they can be shown before the rest load. Defaults to None.
+        """
 
         current_time = time.time()
 
@@ -195,82 +528,396 @@ class AsanaClient:
         if not self.is_configured or not self.projects_api:
             return None
 
+        # Serve stale projects straight away and refresh them in the background, the cache warning shows their age
+        if not force and self.cached_projects is not None:
+            if self._inflight_fetch is None and not self._circuit_blocked():
+                self._start_fetch(opt_fields)
+            return self.cached_projects
+
+        # Join a fetch that's already running instead of making the same requests again,
+        # shielded so one page closing doesn't cancel the fetch for the others
+        if self._inflight_fetch is not None:
+            if on_page:
+                # Catch up on the pages already received, then get the rest as they arrive
+                listener = (on_page, set())
+                self._page_listeners.append(listener)
+                for page in list(self._fetched_pages):
+                    if listener not in self._page_listeners:
+                        break
+                    self._send_page(listener, page)
+            return await asyncio.shield(self._inflight_fetch)
+
+        # Fall back to stale data rather than nothing while Asana is failing
+        if self._circuit_blocked():
+            return self.cached_projects
+
+        return await asyncio.shield(self._start_fetch(opt_fields, on_page))
+
+    def _start_fetch(
+        self, opt_fields: str, on_page: Callable[[list[dict]], None] | None = None
+    ) -> asyncio.Task:
+        """Start fetching all projects in a task that anything asking for projects meanwhile can join"""
+        self._fetched_pages = []
+        self._page_listeners = [(on_page, set())] if on_page else []
+        self._inflight_fetch = asyncio.create_task(
+            self._do_fetch(opt_fields, self._publish_page)
+        )
+        self._inflight_fetch.add_done_callback(self._finish_fetch)
+        return self._inflight_fetch
+
+    def _snapshot_key(self) -> str:
+        """Get a hash of the token and workspace, so a snapshot is only restored for the account that saved it"""
+        account = f"{self.config.get('token')}\n{self.config.get('workspace')}"
+        return hashlib.sha256(account.encode()).hexdigest()
+
+    async def _save_snapshot(self) -> None:
+        """Save the cached projects, so the next run can show them and fetch only what changed since.
+
+        Notes are client information, so the snapshot goes in the user's cache directory, readable only by them,
+        rather than anywhere near the working directory.
+        """
+        try:
+            snapshot = json.dumps(
+                {
+                    "t": self.last_fetch_time,
+                    "key": self._snapshot_key(),
+                    "projects": self.cached_projects,
+                }
+            )
+            await asyncio.to_thread(
+                _write_private_file, _user_cache_dir() / "projects.json", snapshot
+            )
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Couldn't save projects for the next run: {e}")
+
+    def restore_snapshot(self) -> None:
+        """Restore the projects cached by the last run, if they're from the same account and workspace.
+
+        They're treated like any other cache, so they're shown as-is while fresh and used to fetch only modified projects once stale.
+        """
+        # Earlier versions kept the snapshot in NiceGUI's storage in the working directory, don't leave notes there
+        app.storage.general.pop("asana_cache", None)
+
+        path = _user_cache_dir() / "projects.json"
+        try:
+            snapshot = json.loads(path.read_text(encoding="utf-8"))
+            if snapshot["key"] != self._snapshot_key():
+                return
+            projects = snapshot["projects"]
+            fetch_time = snapshot["t"]
+            if not isinstance(projects, list) or not isinstance(
+                fetch_time, int | float
+            ):
+                raise TypeError("Snapshot has the wrong structure")
+            # Holds depend on today's date, so check them again rather than trusting the saved result
+            self._annotate_projects(projects)
+            self._index_projects(projects)
+        except FileNotFoundError:
+            return
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            # A corrupt or outdated snapshot would fail the same way on every run, so start again without it
+            print(f"Discarding projects saved by the last run: {e!r}")
+            self._index_projects([])
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return
+
+        self.cached_projects = projects
+        self.last_fetch_time = fetch_time
+        print(f"{len(projects)} projects restored from last run.")
+
+    def _publish_page(self, page: list[dict]) -> None:
+        """Pass a page from the running fetch to everything waiting on it, keeping it for any that join later"""
+        if asyncio.current_task() is not self._inflight_fetch:
+            # From a fetch detached by save_configs, its listeners and pages belong to the old account
+            return
+        self._fetched_pages.append(page)
+        for listener in list(self._page_listeners):
+            self._send_page(listener, page)
+
+    def _send_page(
+        self, listener: tuple[Callable[[list[dict]], None], set[str]], page: list[dict]
+    ) -> None:
+        """Pass a listener the projects in a page it hasn't been sent yet, a retried fetch lists them all again"""
+        on_page, sent = listener
+        new_projects = [p for p in page if p["gid"] not in sent]
+        if not new_projects:
+            return
+        sent.update(p["gid"] for p in new_projects)
+        try:
+            on_page(new_projects)
+        except (RuntimeError, KeyError, TypeError, ValueError) as e:
+            # A page that was closed, or couldn't show a project, shouldn't stop the fetch for the others.
+            # NiceGUI raises RuntimeError for elements of a page that was closed.
+            print(f"Stopped showing projects on a page: {e}")
+            self._page_listeners.remove(listener)
+
+    def add_fetch_listener(self, listener: Callable[[], None]) -> None:
+        """Call a listener after every successful fetch of all projects, until it's removed"""
+        self._fetch_listeners.append(listener)
+
+    def remove_fetch_listener(self, listener: Callable[[], None]) -> None:
+        """Stop calling a listener added with add_fetch_listener"""
+        if listener in self._fetch_listeners:
+            self._fetch_listeners.remove(listener)
+
+    def _notify_fetch(self) -> None:
+        """Call every fetch listener, see add_fetch_listener"""
+        for listener in list(self._fetch_listeners):
+            try:
+                listener()
+            except RuntimeError as e:
+                # A page that was closed shouldn't stop the others being told
+                print(f"Stopped updating a page after fetches: {e}")
+                self.remove_fetch_listener(listener)
+
+    def _finish_fetch(self, task: asyncio.Task) -> None:
+        """Clear the running fetch once it's done, so the next one starts fresh"""
+        # A detached fetch finishing mustn't clear one started since for the new account
+        if self._inflight_fetch is not task:
+            return
+        self._inflight_fetch = None
+        self._fetched_pages = []
+        self._page_listeners = []
+
+    async def _do_fetch(
+        self,
+        opt_fields: str,
+        on_page: Callable[[list[dict]], None] | None = None,
+    ) -> list[dict] | None:
+        """Fetch all projects from Asana and cache them, retrying rate limits and server errors"""
+        current_time = time.time()
         opts: dict[str, Any] = {
             "limit": 100,
             "archived": False,
             "opt_fields": opt_fields,
         }
 
-        max_retries = 3
-        retry_delay = 1
-        all_projects = []
-
-        for attempt in range(max_retries):
+        fetch = asyncio.current_task()
+        for attempt in range(self.max_retries):
+            # save_configs detaches this fetch when the token or workspace changes, its projects are another account's
+            if self._inflight_fetch is not fetch:
+                return self.cached_projects
+            # Pages joining now only need this attempt's pages, the projects in them are listed again from the start
+            self._fetched_pages = []
             try:
                 print("Fetching fresh projects data...")
-                api_response = self.projects_api.get_projects_for_workspace(
-                    self.config["workspace"],
-                    opts,
-                )
-
-                # Collect all projects from pagination
-                for project in api_response:  # type: ignore
-                    all_projects.append(project)
+                all_projects = await self._fetch_all_projects(opts, on_page)
+                if self._inflight_fetch is not fetch:
+                    print(
+                        "Dropped projects fetched before the account or workspace changed."
+                    )
+                    return self.cached_projects
 
                 # Make cache and store time
+                self._annotate_projects(all_projects)
+                self._index_projects(all_projects)
                 self.cached_projects = all_projects
                 self.last_fetch_time = current_time
+                self.fetch_error = None
+                self._notify_fetch()
+                await self._save_snapshot()
                 print(f"{len(all_projects)} projects found.")
                 return all_projects
 
             except ApiException as e:
-                if e.status == 503 and attempt < max_retries - 1:
-                    print(f"Got 503 error, retrying in {retry_delay} seconds...")
+                if e.status in _RETRYABLE_STATUSES and attempt < self.max_retries - 1:
+                    retry_delay = _retry_delay(e, attempt)
+                    reason = (
+                        "Rate limited" if e.status == 429 else f"Got {e.status} error"
+                    )
+                    print(f"{reason}, retrying in {retry_delay:.1f} seconds...")
                     await asyncio.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
                     continue
                 print(
                     f"Exception when calling ProjectsApi->get_projects_for_workspace: {e}"
                 )
-                return None
+                self.fetch_error = (
+                    "Asana took too long to respond, try refreshing shortly."
+                    if e.status == 408
+                    else f"Couldn't fetch projects from Asana: {e.reason}"
+                )
+                # Keep serving the last projects fetched, if there are any, the cache warning shows their age
+                return self.cached_projects
+
+    async def _fetch_all_projects(
+        self,
+        opts: dict[str, Any],
+        on_page: Callable[[list[dict]], None] | None = None,
+    ) -> list[dict]:
+        """Fetch all projects, only re-fetching modified ones if there is a previous fetch to compare against"""
+        if self._project_by_gid:
+            projects = await self._fetch_modified_projects(opts)
+            if projects is not None:
+                return projects
+
+        return await self._list_projects(opts, on_page)
+
+    async def _fetch_modified_projects(self, opts: dict[str, Any]) -> list[dict] | None:
+        """Compare modification times against the cache and fetch only new or modified projects.
+
+        Args:
+            opts (dict[str, Any]): Options used for the full project listing.
+
+        Returns:
+            list[dict] | None: All projects, or None if a full fetch should be done instead.
+        """
+        timestamps = await self._list_projects({**opts, "opt_fields": "modified_at"})
+        modified = [
+            t["gid"]
+            for t in timestamps
+            if t["gid"] not in self._project_by_gid
+            or self._project_by_gid[t["gid"]].get("modified_at") != t["modified_at"]
+        ]
+        if len(modified) > self.max_delta_fetches:
+            return None
+
+        print(f"{len(modified)} projects modified since last fetch.")
+        fetched = await asyncio.gather(
+            *(self.fetch_project(gid, opts["opt_fields"]) for gid in modified)
+        )
+        if any(project is None for project in fetched):
+            return None
+
+        by_gid = self._project_by_gid | {p["gid"]: p for p in fetched}  # type: ignore
+        return [by_gid[t["gid"]] for t in timestamps]
+
+    async def _list_projects(
+        self,
+        opts: dict[str, Any],
+        on_page: Callable[[list[dict]], None] | None = None,
+    ) -> list[dict]:
+        """Collect all projects in the workspace from pagination, passing each page to on_page as it arrives"""
+        # The SDK blocks while it pages through results, so keep it off the event loop.
+        # A failed page ends the SDK's generator, so pages aren't retried here, callers retry the whole listing.
+        # Creating the generator doesn't request anything, the first page is requested when it's first iterated
+        projects = iter(
+            self.projects_api.get_projects_for_workspace(  # type: ignore
+                self.config["workspace"],
+                opts,
+                _request_timeout=self.request_timeout,
+            )
+        )
+
+        def next_page() -> asyncio.Task:
+            # Take one page worth of items, so the SDK only requests the following page on the next call
+            return asyncio.create_task(
+                self._call_api_once(list, islice(projects, opts["limit"]))
+            )
+
+        # Each page needs the previous page's offset, so pages can't be fetched in parallel,
+        # but the next page can be fetched while the current one is handled
+        all_projects = []
+        pending_page = next_page()
+        try:
+            while page := await pending_page:
+                pending_page = next_page()
+                all_projects.extend(page)
+                if on_page:
+                    on_page(page)
+        finally:
+            pending_page.cancel()
+        return all_projects
+
+    def _annotate_projects(self, projects: list[dict]) -> None:
+        """Store the result of the hold and IFSP checks on each cached project so filtering doesn't repeat them"""
+        self._filter_cache = {}
+        held_count = 0
+        for project in projects:
+            project["_hold_active"] = self._check_hold(project)
+            project["_has_ifsp"] = self._check_ifsp(project)
+            held_count += project["_hold_active"]
+        self._held_count = held_count
+
+    def _index_projects(self, projects: list[dict]) -> None:
+        """Index cached projects by GID and by color, both in the order of the cache and in order of creation"""
+        self._project_by_gid = {p["gid"]: p for p in projects}
+        self._prefetches = {}
+        self._index_positions(projects)
+
+    def _index_positions(self, projects: list[dict]) -> None:
+        """Index the positions of cached projects by color, both in the order of the cache and in order of creation"""
+        self._filter_cache = {}
+        positions_by_color: dict[str, list[int]] = {}
+        for i, project in enumerate(projects):
+            positions_by_color.setdefault(project["color"], []).append(i)
+        self._positions_by_color = positions_by_color
+
+        created = list(map(itemgetter("created_at"), projects))
+        positions_by_created = sorted(range(len(projects)), key=created.__getitem__)
+        creation_rank = [0] * len(projects)
+        positions_by_color_created: dict[str, list[int]] = {}
+        for rank, i in enumerate(positions_by_created):
+            creation_rank[i] = rank
+            positions_by_color_created.setdefault(projects[i]["color"], []).append(i)
+        self._positions_by_created = positions_by_created
+        self._positions_by_color_created = positions_by_color_created
+        self._creation_rank = creation_rank
+
+    def _cached_projects_of_colors(
+        self, internal_colors: frozenset[str] | None, by_creation: bool = False
+    ) -> list[dict]:
+        """Get cached projects with any of the given internal colors (or all of them if None), keeping the order of the cache or sorted by creation"""
+        if internal_colors is None:
+            if not by_creation:
+                return self.cached_projects  # type: ignore
+            positions = self._positions_by_created
+        else:
+            index = (
+                self._positions_by_color_created
+                if by_creation
+                else self._positions_by_color
+            )
+            if len(internal_colors) == 1:
+                positions = index.get(next(iter(internal_colors)), [])
+            else:
+                positions = sorted(
+                    chain.from_iterable(
+                        index.get(color, []) for color in internal_colors
+                    ),
+                    key=self._creation_rank.__getitem__ if by_creation else None,
+                )
+        return [self.cached_projects[i] for i in positions]  # type: ignore
 
     def is_on_hold(self, project: dict) -> bool:
         """Return True if a project has a hold date with the users initials that is after today, False if otherwise"""
-        if not project.get("notes"):
+        hold_active = project.get("_hold_active")
+        if hold_active is not None:
+            return hold_active
+        return self._check_hold(project)
+
+    def has_ifsp(self, project: dict) -> bool:
+        """Return True if 'IFSP' is present in the notes field, False otherwise"""
+        has_ifsp = project.get("_has_ifsp")
+        if has_ifsp is not None:
+            return has_ifsp
+        return self._check_ifsp(project)
+
+    def _check_hold(self, project: dict) -> bool:
+        """Search a project's notes for an active hold, see is_on_hold"""
+        notes = project.get("notes")
+        if not notes:
             return False
 
         user_initials = self.config.get("initials")
         if not user_initials:
             return False
 
-        notes = project["notes"]
-        hold_pattern = re.compile(
-            r"(?:.*?\s)?hold\s+(\d{1,2}/\d{1,2}(?:/\d{2,4})?)\s+[/]*(\w+)[/]*"  # hold 01/31/24 JS | hold 01/31 AJP
-        )
+        # Most notes have no holds for this user at all, and substring checks are much cheaper than the regex
+        notes_lower = notes.lower()
+        if "hold" not in notes_lower or user_initials.lower() not in notes_lower:
+            return False
 
-        for match in hold_pattern.finditer(notes):
+        for match in _HOLD_RE.finditer(notes):
             date_str, initials = match.groups()
 
             if initials.upper() != user_initials.upper():
                 continue
 
             try:
-                hold_date = None
-                # Handle different date formats
-                if "/" in date_str:
-                    if date_str.count("/") == 1:
-                        hold_date = (
-                            datetime.strptime(date_str, "%m/%d")
-                            .replace(year=date.today().year)
-                            .date()
-                        )
-                    else:
-                        # Handle 2 or 4 digit years
-                        try:
-                            hold_date = datetime.strptime(date_str, "%m/%d/%Y").date()
-                        except ValueError:
-                            hold_date = datetime.strptime(date_str, "%m/%d/%y").date()
-
+                hold_date = _parse_hold_date(date_str, date.today().year)
                 if hold_date is not None:
                     # If hold date is today or in the future, project should be hidden
                     return hold_date >= date.today()
@@ -281,12 +928,14 @@ class AsanaClient:
 
         return False
 
-    def has_ifsp(self, project: dict) -> bool:
-        """Return True if 'IFSP' is present in the notes field, False otherwise"""
-        if not project.get("notes"):
+    def _check_ifsp(self, project: dict) -> bool:
+        """Search a project's notes for 'IFSP', see has_ifsp"""
+        notes = project.get("notes")
+        if not notes:
             return False
 
-        return bool(re.search(r"\bIFSP\b", project["notes"].upper()))
+        # Case-insensitive pattern, so notes don't need to be copied with .upper()
+        return _IFSP_RE.search(notes) is not None
 
     def filter_projects(
         self,
@@ -295,6 +944,7 @@ class AsanaClient:
         with_dates: bool = False,
         ifsp_only: bool = False,
         is_other: bool = False,
+        sort_by_creation: bool = False,
     ) -> tuple[list[dict], int]:
         """Filter a provided projects list based on color, dates, 'IFSP' being in the notes field, or colors not used in other configs
 
@@ -304,6 +954,7 @@ class AsanaClient:
             with_dates (bool, optional): Whether to filter to only projects that have dates. Defaults to False.
             ifsp_only (bool, optional): Whether to filter to only projects that have 'IFSP' in the notes field. Defaults to False.
             is_other (bool, optional): Whether to filter to only projects that use colors that have not been used in other configs. Defaults to False.
+            sort_by_creation (bool, optional): Whether to sort the filtered projects by creation date. Defaults to False.
 
         Returns:
             tuple[list[dict], int]: Filtered projects and number of projects on hold.
@@ -311,34 +962,218 @@ class AsanaClient:
         if not projects:
             return [], 0
 
-        held_projects = sum(1 for p in projects if self.is_on_hold(p))
-        filtered = [p for p in projects if not self.is_on_hold(p)]
+        excluded_colors = self._used_internal_colors if is_other else None
+        internal_colors = (
+            frozenset(self._internal_color_by_key[c] for c in colors)
+            if colors and not is_other
+            else None
+        )
+        # Bound to locals since they're used for every project
+        is_on_hold = self.is_on_hold
+        has_ifsp = self.has_ifsp
+        date_search = _DATE_IN_NAME_RE.search
+
+        if projects is self.cached_projects:
+            # Pages ask for the same few filters again and again between fetches
+            cache_key = (
+                internal_colors,
+                with_dates,
+                ifsp_only,
+                is_other,
+                sort_by_creation,
+            )
+            cached = self._filter_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # Only visit cached projects of the requested colors, in the requested order, using the indexes built
+            # when they were fetched. Projects on hold are counted across all projects, which was also done then.
+            candidates = self._cached_projects_of_colors(
+                internal_colors, sort_by_creation
+            )
+            held_projects = self._held_count
+            count_held = False
+        else:
+            cache_key = None
+            candidates = projects
+            held_projects = 0
+            count_held = True
+
+        # Apply every filter in a single pass, skipping a project at the first one it fails
+        filtered = []
+        for p in candidates:
+            # Projects on hold are counted across all projects, so check that first
+            if is_on_hold(p):
+                if count_held:
+                    held_projects += 1
+                continue
+            if excluded_colors is not None and p["color"] in excluded_colors:
+                continue
+            if internal_colors is not None and p["color"] not in internal_colors:
+                continue
+            if with_dates and not date_search(p["name"]):
+                continue
+            if ifsp_only and not has_ifsp(p):
+                continue
+            filtered.append(p)
 
-        if is_other:
-            used_colors = set()
-            for config in self.page_configs.values():
-                if config.get("colors") and not config.get("is_other"):
-                    for color in config["colors"]:
-                        used_colors.add(self.colors[color]["name"])
+        # Projects that aren't cached have no index to take the order from
+        if sort_by_creation and candidates is projects:
+            filtered.sort(key=itemgetter("created_at"))
 
-            filtered = [p for p in filtered if p["color"] not in used_colors]
-        elif colors:
-            internal_colors = [self.colors[c]["name"] for c in colors]
-            filtered = [p for p in filtered if p["color"] in internal_colors]
+        if cache_key is not None:
+            self._filter_cache[cache_key] = (filtered, held_projects)
+        return filtered, held_projects
 
-        if with_dates:
-            filtered = [
-                p
-                for p in filtered
-                if re.search(r"\d{1,2}.\d{1,2}(.\d{1,4})?", p["name"])
-            ]
+    async def _call_api(self, func: Callable, *args, **kwargs) -> Any:
+        """Make an SDK call with _call_api_once, retrying rate limits, server errors and timeouts up to max_retries times"""
+        # Applied by the SDK to the socket, so a stalled request frees its worker thread too
+        kwargs.setdefault("_request_timeout", self.request_timeout)
+        for attempt in range(self.max_retries):
+            try:
+                return await self._call_api_once(func, *args, **kwargs)
+            except ApiException as e:
+                # Stop retrying once the circuit opens, more requests would only add to the outage.
+                # A write that timed out may still have been applied, so only reads are retried after a timeout,
+                # otherwise a note could be added twice.
+                if (
+                    e.status not in _RETRYABLE_STATUSES
+                    or (
+                        e.status == 408
+                        and not getattr(func, "__name__", "").startswith("get_")
+                    )
+                    or attempt == self.max_retries - 1
+                    or self._circuit["state"] == "open"
+                ):
+                    raise
+                if e.status == 429:
+                    # The rate limiter is already paused for as long as Asana asked
+                    retry_delay = max(
+                        0.0, self._rate_bucket["paused_until"] - time.monotonic()
+                    )
+                    reason = "Rate limited"
+                else:
+                    retry_delay = _retry_delay(e, attempt)
+                    reason = f"Got {e.status} error"
+                print(f"{reason}, retrying in {retry_delay:.1f} seconds...")
+                await asyncio.sleep(retry_delay)
+
+    async def _call_api_once(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking SDK call in a worker thread so it doesn't block the event loop, limiting calls in flight and their rate"""
+        # Fail fast rather than waiting for a turn to call an API that's failing
+        if self._circuit_blocked():
+            raise ApiException(
+                status=0, reason="Asana is unavailable, try again shortly"
+            )
+        await self._take_rate_token()
+        async with self._api_semaphore:
+            # Checked again right before calling, since this may be the probing call or the circuit opened meanwhile
+            if not self._circuit_allows():
+                raise ApiException(
+                    status=0, reason="Asana is unavailable, try again shortly"
+                )
+            try:
+                try:
+                    result = await asyncio.wait_for(
+                        asyncio.to_thread(func, *args, **kwargs), self.request_timeout
+                    )
+                except TimeoutError:
+                    # Raised as the SDK's exception so callers handle it like any other failed call
+                    raise ApiException(
+                        status=408, reason="Request to Asana timed out"
+                    ) from None
+                except urllib3.exceptions.HTTPError as e:
+                    # The SDK only wraps SSL errors, so socket timeouts and dropped connections are converted here,
+                    # timeouts to the same 408 as above and the rest to the SDK's status 0 for connection errors
+                    timed_out = isinstance(
+                        getattr(e, "reason", e), urllib3.exceptions.TimeoutError
+                    )
+                    raise ApiException(
+                        status=408 if timed_out else 0,
+                        reason=f"{type(e).__name__}: {e}",
+                    ) from e
+            except ApiException as e:
+                if e.status == 429:
+                    self._rate_bucket["paused_until"] = time.monotonic() + _retry_delay(
+                        e, 0
+                    )
+                # Any response below 500 shows Asana is up, even if it refused this call.
+                # Status 0 is the SDK's code for connection errors like failed SSL handshakes.
+                if e.status and e.status < 500 and e.status != 408:
+                    self._record_success()
+                else:
+                    self._record_failure()
+                raise
+            except Exception:
+                # Errors raised without a response at all, like dropped connections
+                self._record_failure()
+                raise
+        self._record_success()
+        return result
+
+    async def _take_rate_token(self) -> None:
+        """Wait until the token bucket has a request to spare, refilling it for the time since it was last used"""
+        bucket = self._rate_bucket
+        rate = self.requests_per_minute / 60
+        while True:
+            now = time.monotonic()
+            if now < bucket["paused_until"]:
+                await asyncio.sleep(bucket["paused_until"] - now)
+                continue
+            bucket["tokens"] = min(
+                self.request_burst, bucket["tokens"] + (now - bucket["updated"]) * rate
+            )
+            bucket["updated"] = now
+            if bucket["tokens"] >= 1:
+                bucket["tokens"] -= 1
+                return
+            await asyncio.sleep((1 - bucket["tokens"]) / rate)
+
+    def _circuit_blocked(self) -> bool:
+        """Return True while the circuit is open after repeated server errors, without claiming the probing call"""
+        circuit = self._circuit
+        if circuit["state"] == "half_open":
+            # Only the probing call is allowed through until it succeeds or fails, unless it's taken longer than
+            # a request can, since a probe cancelled before its request was sent would otherwise block calls for good
+            return time.time() - circuit["probe_at"] < self.request_timeout
+        if circuit["state"] == "open":
+            return time.time() - circuit["opened_at"] < self._circuit_cool_off()
+        return False
 
-        if ifsp_only:
-            filtered = [p for p in filtered if self.has_ifsp(p)]
+    def _circuit_allows(self) -> bool:
+        """Return True if an API call may be made now, making it the probing call once the circuit has cooled off"""
+        if self._circuit_blocked():
+            return False
+        if self._circuit["state"] != "closed":
+            self._circuit["state"] = "half_open"
+            self._circuit["probe_at"] = time.time()
+        return True
+
+    def _circuit_cool_off(self) -> int:
+        """Get how long the circuit stays open, 30 seconds doubling with each consecutive open up to 5 minutes"""
+        return min(300, 30 * 2 ** (self._circuit["opens"] - 1))
+
+    def _record_failure(self) -> None:
+        """Count a server error, opening the circuit at the threshold or if the probing call failed"""
+        circuit = self._circuit
+        circuit["failures"] += 1
+        if (
+            circuit["state"] == "half_open"
+            or circuit["failures"] >= self.circuit_failure_threshold
+        ):
+            circuit["state"] = "open"
+            circuit["opens"] += 1
+            circuit["opened_at"] = time.time()
+            circuit["failures"] = 0
+            print(
+                f"Asana is failing, pausing requests for {self._circuit_cool_off()} seconds."
+            )
 
-        return filtered, held_projects
+    def _record_success(self) -> None:
+        """Close the circuit after a successful call"""
+        self._circuit.update(state="closed", failures=0, opens=0)
 
-    def fetch_project(
+    async def fetch_project(
         self,
         project_gid: str,
         opt_fields: str = "name,color,permalink_url,notes,created_at",
@@ -347,8 +1182,12 @@ class AsanaClient:
         if not self.is_configured or not self.projects_api:
             return None
 
+        if self._circuit_blocked():
+            return None
+
         try:
-            return self.projects_api.get_project(
+            return await self._call_api(
+                self.projects_api.get_project,
                 project_gid,
                 opts={"opt_fields": opt_fields},  # type: ignore
             )
@@ -356,53 +1195,122 @@ class AsanaClient:
             print(f"Exception when calling ProjectsApi->get_project: {e}")
             return None
 
-    def replace_notes(self, new_note: str, project_gid: str):
-        """Update the notes field in a project."""
-        if not self.is_configured or not self.projects_api:
-            return None
+    def prefetch_project(self, project_gid: str) -> asyncio.Task:
+        """Refresh a cached project's name and notes in the background, once per full fetch, so they're current when it's reviewed.
 
-        body = {"data": {"notes": new_note}}
-        try:
-            self.projects_api.update_project(
-                body, project_gid, opts={"opt_fields": "name, notes"}
+        Args:
+            project_gid (str): GID of the cached project.
+
+        Returns:
+            asyncio.Task: Task that finishes once the cached project has been refreshed, or refreshing it failed.
+        """
+        task = self._prefetches.get(project_gid)
+        if task is None:
+            # Through NiceGUI, so the task is kept alive until it's done and anything it raises is logged
+            task = background_tasks.create(
+                self._refresh_cached_project(project_gid),
+                name=f"prefetch project {project_gid}",
             )
-            return "Note added."
-        except ApiException as e:
-            return f"Exception when calling ProjectsApi->update_project: {e}"
+            self._prefetches[project_gid] = task
+        return task
+
+    async def _refresh_cached_project(self, project_gid: str) -> None:
+        """Fetch the latest name and notes of a cached project and write them through to the cache"""
+        # Notes being added wait for this, so it can't write back notes from before them
+        async with self._note_locks.setdefault(project_gid, asyncio.Lock()):
+            try:
+                fresh = await self.fetch_project(project_gid, opt_fields="name,notes")
+            except (ApiException, OSError) as e:
+                # Includes timeouts, the project is shown with its cached notes instead
+                print(f"Couldn't refresh project {project_gid}: {e}")
+                return
+            project = self._project_by_gid.get(project_gid)
+            if not fresh or project is None:
+                return
+            project["name"] = fresh["name"]
+            self._update_cached_notes(project_gid, fresh.get("notes") or "")
+
+    def _update_cached_notes(self, project_gid: str, notes: str) -> None:
+        """Write new notes through to the cached project, checking its hold and IFSP status again since they come from the notes"""
+        project = self._project_by_gid.get(project_gid)
+        if project is None:
+            return
+
+        self._filter_cache = {}
+        was_held = project.get("_hold_active", False)
+        project["notes"] = notes
+        project["_hold_active"] = self._check_hold(project)
+        project["_has_ifsp"] = self._check_ifsp(project)
+        self._held_count += project["_hold_active"] - was_held
+
+    def _update_cached_color(self, project_gid: str, internal_color: str) -> None:
+        """Write a new color through to the cached project, moving it to that color's lists"""
+        project = self._project_by_gid.get(project_gid)
+        if project is None or project["color"] == internal_color:
+            return
 
-    def change_color(self, new_color: str, project_gid: str):
-        """Update the color of a project, using the external color name."""
+        project["color"] = internal_color
+        if self.cached_projects is not None:
+            self._index_positions(self.cached_projects)
+
+    async def replace_notes(
+        self, new_note: str, project_gid: str, new_color: str | None = None
+    ):
+        """Update the notes field in a project, and its color in the same request if given, using the external color name."""
         if not self.is_configured or not self.projects_api:
             return None
 
-        internal_color = self.colors.get(new_color)
-        if not internal_color:
-            return f"Invalid color: {new_color}"
-        internal_color = internal_color["name"]
+        body = {"data": {"notes": new_note}}
+        if new_color:
+            internal_color = self.colors.get(new_color)
+            if not internal_color:
+                return f"Invalid color: {new_color}"
+            body["data"]["color"] = internal_color["name"]
+
+        if self._circuit_blocked():
+            return "Asana is unavailable, try again shortly."
 
-        body = {"data": {"color": internal_color}}
         try:
-            self.projects_api.update_project(
-                body, project_gid, opts={"opt_fields": "name, color"}
+            await self._call_api(
+                self.projects_api.update_project,
+                body,
+                project_gid,
+                opts={"opt_fields": "name"},
             )
-            return f"Color changed to {new_color}."
+            self._update_cached_notes(project_gid, new_note)
+            if new_color:
+                self._update_cached_color(project_gid, body["data"]["color"])
+                return f"Note added and color changed to {new_color}."
+            return "Note added."
         except ApiException as e:
             return f"Exception when calling ProjectsApi->update_project: {e}"
 
-    def add_note(self, new_note: str, project_gid: str):
-        """Add a note to the top of a project's notes field."""
+    def _today_str(self) -> str:
+        """Get today's date as MM/DD for the start of a note"""
+        today = date.today()
+        if self._today is None or self._today[0] != today:
+            self._today = (today, today.strftime("%m/%d"))
+        return self._today[1]
+
+    async def add_note(
+        self, new_note: str, project_gid: str, new_color: str | None = None
+    ):
+        """Add a note to the top of a project's notes field, changing its color in the same update if given."""
         if not self.is_configured or not self.projects_api:
             return None
 
-        today_str = datetime.now().strftime("%m/%d")
-        new_note = today_str + " " + new_note
         initials = self.config.get("initials")
-        if initials:
-            new_note += " ///" + initials
-
-        # Ensure project is not being overwritten with old data
-        current_project: dict[str, str] | None = self.fetch_project(project_gid)
-        if current_project:
+        signature = f" ///{initials}" if initials else ""
+        new_note = f"{self._today_str()} {new_note}{signature}"
+
+        # Ensure project is not being overwritten with old data, only notes are needed for that.
+        # Held for the whole read-modify-write, so another note on the same project waits for this one to be written.
+        async with self._note_locks.setdefault(project_gid, asyncio.Lock()):
+            current_project: dict[str, str] | None = await self.fetch_project(
+                project_gid, opt_fields="notes"
+            )
+            if not current_project:
+                return
             current_notes = current_project.get("notes", "")
             notes_by_line = current_notes.split("\n")
             # Check if there is a blank line in the first 5 lines
@@ -417,7 +1325,7 @@ class AsanaClient:
                 # Otherwise, add the note to the top as normal
                 notes_by_line.insert(0, new_note)
             new_notes = "\n".join(notes_by_line)
-            self.replace_notes(new_notes, project_gid)
+            return await self.replace_notes(new_notes, project_gid, new_color)
 
     # TODO: add progress
     async def update_all_projects_permissions(
@@ -427,19 +1335,38 @@ class AsanaClient:
         if not self.is_configured or not self.projects_api or not self.users_api:
             return None
 
-        projects = await self.fetch_projects()
+        if self._circuit_blocked():
+            return "Asana is unavailable, try again shortly."
+
+        # Only this needs access levels, so they're listed here rather than kept on every cached project
+        try:
+            projects = await self._list_projects(
+                {
+                    "limit": 100,
+                    "archived": False,
+                    "opt_fields": "name,default_access_level",
+                }
+            )
+        except ApiException as e:
+            return (
+                f"Exception when calling ProjectsApi->get_projects_for_workspace: {e}"
+            )
         if not projects:
             return "No projects found"
 
         total = len(projects)
         completed = 0
+        members_body = {"data": {"members": ",".join(members_list)}}
 
-        for project in projects:
+        async def update_project(project: dict):
             if project.get("default_access_level") != "admin":
                 body = {"data": {"default_access_level": "admin"}}
                 try:
-                    self.projects_api.update_project(
-                        body, project["gid"], opts={"opt_fields": "name"}
+                    await self._call_api(
+                        self.projects_api.update_project,  # type: ignore
+                        body,
+                        project["gid"],
+                        opts={"opt_fields": "name"},
                     )
                 except ApiException as e:
                     print(
@@ -452,25 +1379,49 @@ class AsanaClient:
             #     self.config["workspace"], opts
             # )
             try:
-                body = {"data": {"members": ",".join(members_list)}}
-                self.projects_api.add_members_for_project(
-                    body, project["gid"], opts={"opt_fields": "name"}
+                await self._call_api(
+                    self.projects_api.add_members_for_project,  # type: ignore
+                    members_body,
+                    project["gid"],
+                    opts={"opt_fields": "name"},
                 )
             except ApiException as e:
                 print(f"Error adding members to {project['name']}: {e}")
 
-            completed += 1
-            print(completed)
-            print(total)
-            if progress_callback:
-                progress_callback(completed, total)
+        # Projects are updated concurrently, _call_api keeps the writes in flight within Asana's limit.
+        # Progress is reported from this task as each one finishes, since the callback may create UI elements,
+        # which NiceGUI only allows in the task that handles the page.
+        updates = {
+            asyncio.create_task(update_project(project)): project
+            for project in projects
+        }
+        try:
+            async for update in asyncio.as_completed(updates):
+                try:
+                    await update
+                except (ApiException, OSError) as e:
+                    # Connection errors can still get past update_project, one failed project shouldn't stop the rest
+                    print(f"Error updating {updates[update]['name']}: {e}")
+                completed += 1
+                print(completed)
+                print(total)
+                if progress_callback:
+                    progress_callback(completed, total)
+        finally:
+            # Don't leave writes running if reporting progress failed
+            for update in updates:
+                update.cancel()
 
         return f"Updated {completed} projects"
 
 
 def create_app():
+    # Load variables from .env, only when the app runs rather than whenever this module is imported
+    load_dotenv()
     client = AsanaClient()
     is_initialized = False
+    # Restored once the app starts, since that's when storage is loaded to clear snapshots earlier versions left there
+    app.on_startup(client.restore_snapshot)
 
     def create_loading_overlay() -> Element:
         overlay = ui.element("div").classes(
@@ -515,40 +1466,77 @@ def create_app():
             is_other (bool, optional): Whether to filter to only projects that have colors that are not in any other config. Defaults to False.
         """
         page_title = ui.label(f"{title}").classes("text-lg")
+        project_list = ui.column()
+        # Projects are shown in a paginated table, so long lists don't send a link for every project to the browser
+        with project_list:
+            project_table = ui.table(
+                columns=[
+                    {"name": "name", "label": "Name", "field": "name", "align": "left"}
+                ],
+                rows=[],
+                row_key="gid",
+                pagination=50,
+            ).props("flat dense hide-header")
+            project_table.add_slot(
+                "body-cell-name",
+                r"""
+                <q-td :props="props">
+                    <a :href="props.row.permalink_url" target="_blank" class="nicegui-link">{{ props.value }}</a>
+                </q-td>
+                """,
+            )
 
-        projects = await client.fetch_projects()
+        def to_row(project: dict) -> dict:
+            """Get the fields of a project used by the table, leaving the rest out of what is sent to the browser."""
+            return {
+                "gid": project["gid"],
+                "name": f"{project['name']} ({project['color']})"
+                if is_other
+                else project["name"],
+                "permalink_url": project["permalink_url"],
+            }
+
+        def show_page(page: list[dict]):
+            """Show matching projects from a page as soon as it arrives, replaced by the sorted list once all are in."""
+            matching, _ = client.filter_projects(
+                page, colors, with_dates, ifsp_only, is_other
+            )
+            if matching:
+                project_table.add_rows(*map(to_row, matching))
+
+        # Send the page to the browser first, so streamed projects appear while the rest are fetched
+        await ui.context.client.connected()
+        projects = await client.fetch_projects(on_page=show_page)
+        if client.fetch_error:
+            ui.notify(client.fetch_error, type="warning")
         if not projects:
-            ui.label("No projects found")
+            project_list.clear()
+            with project_list:
+                ui.label("No projects found")
             return
 
         filtered_projects, held_count = client.filter_projects(
-            projects, colors, with_dates, ifsp_only, is_other
+            projects, colors, with_dates, ifsp_only, is_other, sort_by_creation
         )
 
-        if sort_by_creation:
-            filtered_projects.sort(key=lambda p: p["created_at"])
-
         def open_all_links():
-            for project in filtered_projects:
-                ui.navigate.to(project["permalink_url"], new_tab=True)
-
-        if len(filtered_projects) <= 10:
-            ui.button("Open All Links in Asana", on_click=open_all_links).classes(
-                "mb-4"
-            )
+            # Opened by one script in the browser instead of a navigation message per link
+            urls = json.dumps([p["permalink_url"] for p in filtered_projects])
+            ui.run_javascript(f"{urls}.forEach(url => window.open(url, '_blank'));")
 
         title_text = f"{title} ({len(filtered_projects)})"
         if held_count > 0:
             title_text += f" [{held_count} on hold]"
         page_title.set_text(title_text)
 
-        for project in filtered_projects:
-            link_text = (
-                f"{project['name']} ({project['color']})"
-                if is_other
-                else project["name"]
-            )
-            ui.link(link_text, project["permalink_url"], new_tab=True)
+        project_table.rows = list(map(to_row, filtered_projects))
+        project_table.update()
+
+        if len(filtered_projects) <= 10:
+            with project_list:
+                ui.button("Open All Links in Asana", on_click=open_all_links).classes(
+                    "mb-4"
+                ).move(target_index=0)
 
     def show_settings(force: bool = False):
         """Open a dialog with fields for each config value in client.config."""
@@ -576,7 +1564,7 @@ def create_app():
             }
 
             async def _save_settings():
-                """Save settings using client.save_config"""
+                """Save settings using client.save_configs"""
                 all_fields_filled = all(
                     input_field.value for input_field in inputs.values()
                 )
@@ -587,8 +1575,9 @@ def create_app():
                 ui.notify("Settings saved", type="positive")
                 dialog.close()
 
-                for key, input_field in inputs.items():
-                    client.save_config(key, input_field.value)
+                await client.save_configs(
+                    {key: input_field.value for key, input_field in inputs.items()}
+                )
 
             with ui.row():
                 ui.button("Save", on_click=_save_settings).props("icon=save")
@@ -616,6 +1605,22 @@ def create_app():
 
         return ui.label(f"Data age: {time_text}").classes("text-white")
 
+    def seconds_until_staleness_changes() -> float:
+        """Get how long until the data age label's text changes.
+
+        Past the first minute the label only changes once a minute, and past the first hour once an hour,
+        so there's no need to check every second. Fetches reset the age through client.add_fetch_listener instead.
+        """
+        if client.last_fetch_time is None:
+            return 1.0
+
+        elapsed_seconds = time.time() - client.last_fetch_time
+        if elapsed_seconds < 60:
+            return 1.0
+        if elapsed_seconds < 3600:
+            return 60 - elapsed_seconds % 60
+        return 3600 - elapsed_seconds % 3600
+
     # TODO: add progress
     async def refresh_projects():
         """Fetch projects and reload the page."""
@@ -646,7 +1651,7 @@ def create_app():
             return
 
     def create_header(refresh=True, root_page=False):
-        with ui.header().classes("items-center justify-between"):
+        with ui.header().classes("items-center justify-between") as header:
             ui.link("Asana Tool", "/").classes(
                 "text-xl font-bold text-white no-underline"
             )
@@ -662,18 +1667,38 @@ def create_app():
                         "flat color=white"
                     )
 
-        if refresh:
-            display_cache_warning()
+        # Pages without the staleness label have nothing for a timer to update
+        if not refresh:
+            return
+
+        display_cache_warning()
+        staleness_timer: ui.timer | None = None
+
+        def schedule_staleness_update():
+            # Sleep until the label next changes, client.cache_duration is on a minute boundary so the warning is too
+            nonlocal staleness_timer
+            if staleness_timer is not None:
+                staleness_timer.cancel()
+            with header:
+                staleness_timer = ui.timer(
+                    seconds_until_staleness_changes(), update_staleness, once=True
+                )
 
-        ui.timer(1.0, display_staleness.refresh)
-        ui.timer(1.0, display_cache_warning.refresh)
+        def update_staleness():
+            display_staleness.refresh()
+            display_cache_warning.refresh()
+            schedule_staleness_update()
 
-    def get_button_style(colors):
-        if isinstance(colors, list):
-            if len(colors) > 1:
-                return f"!bg-gradient-to-r from-[{client.colors[colors[0]]['color']}] to-[{client.colors[colors[1]]['color']}] !text-black"
-            return f"!bg-[{client.colors[colors[0]]['color']}] !text-black"
-        return f"!bg-[{client.colors[colors]['color']}] !text-black"
+        def on_fetch():
+            # A fetch from any page resets the age, which the sleeping timer wouldn't notice until it wakes
+            if header.is_deleted:
+                client.remove_fetch_listener(on_fetch)
+                return
+            with header:
+                update_staleness()
+
+        client.add_fetch_listener(on_fetch)
+        schedule_staleness_update()
 
     def create_colored_button(title: str, colors: list[str], on_click: Callable):
         """Create a button link with a background color or gradient.
@@ -688,72 +1713,50 @@ def create_app():
         """
         button = ui.button(title, on_click=on_click)
 
-        button.classes(get_button_style(colors))
+        button.classes(client.button_classes(colors))
         return button
 
-    def should_show_button(config, user_initials, hide_buttons) -> bool:
-        """Determine if a button should be hidden based on a user's initials and the config."""
-        if not hide_buttons:
-            return True
-        return "users" in config and user_initials in config.get("users", [])
-
     @ui.page("/")
     async def root():
         create_header(root_page=True)
 
         with ui.row():
-            user_initials = client.config.get("initials")
-            hide_buttons = (
-                any(
-                    "users" in config and user_initials in config["users"]
-                    for config in client.page_configs.values()
-                )
-                if user_initials
-                else False
+            list_buttons, review_buttons = client.visible_buttons(
+                client.config.get("initials")
             )
 
             with ui.column():
                 ui.label("List:").classes("text-lg")
 
-                for config_key, config in client.page_configs.items():
-                    if not should_show_button(config, user_initials, hide_buttons):
-                        continue
-
-                    if "list" in config.get("types", []):
-                        if config.get("is_other"):
-                            ui.button(
-                                config["title"],
-                                on_click=lambda k=config_key: ui.navigate.to(
-                                    f"/list/{k}"
-                                ),
-                            ).classes("!bg-gray-400 !text-black")
-                        else:
-                            create_colored_button(
-                                config["title"],
-                                config["colors"],
-                                lambda k=config_key: ui.navigate.to(f"/list/{k}"),
-                            )
+                for config_key, config in list_buttons:
+                    if config.get("is_other"):
+                        ui.button(
+                            config["title"],
+                            on_click=lambda k=config_key: ui.navigate.to(f"/list/{k}"),
+                        ).classes("!bg-gray-400 !text-black")
+                    else:
+                        create_colored_button(
+                            config["title"],
+                            config["colors"],
+                            lambda k=config_key: ui.navigate.to(f"/list/{k}"),
+                        )
 
             with ui.column():
                 ui.label("Review:").classes("text-lg")
-                for config_key, config in client.page_configs.items():
-                    if not should_show_button(config, user_initials, hide_buttons):
-                        continue
-
-                    if "review" in config.get("types", []):
-                        if config.get("is_other"):
-                            ui.button(
-                                config["title"],
-                                on_click=lambda k=config_key: ui.navigate.to(
-                                    f"/review/{k}"
-                                ),
-                            ).classes("!bg-gray-400 !text-black")
-                        else:
-                            create_colored_button(
-                                config["title"],
-                                config["colors"],
-                                lambda k=config_key: ui.navigate.to(f"/review/{k}"),
-                            )
+                for config_key, config in review_buttons:
+                    if config.get("is_other"):
+                        ui.button(
+                            config["title"],
+                            on_click=lambda k=config_key: ui.navigate.to(
+                                f"/review/{k}"
+                            ),
+                        ).classes("!bg-gray-400 !text-black")
+                    else:
+                        create_colored_button(
+                            config["title"],
+                            config["colors"],
+                            lambda k=config_key: ui.navigate.to(f"/review/{k}"),
+                        )
 
             with ui.column():
                 ui.label("Tools:").classes("text-lg")
@@ -851,7 +1854,11 @@ def create_app():
 
         ui.label(f"Reviewing {config['title']}").classes("text-lg")
 
+        # Send the page to the browser first, a cold fetch can take longer than NiceGUI waits for a page to respond
+        await ui.context.client.connected()
         projects = await client.fetch_projects()
+        if client.fetch_error:
+            ui.notify(client.fetch_error, type="warning")
         if not projects:
             ui.label("No projects found")
             return
@@ -873,137 +1880,178 @@ def create_app():
             ).classes("text-sm text-gray-500")
 
         current_index = 0
+        project_count = len(filtered_projects)
 
-        @ui.refreshable
-        def show_current_project():
-            nonlocal current_index
-            with ui.card().classes("w-full max-w-2xl mx-auto p-4"):
+        def send_update(project: dict, update: Awaitable[str | None]):
+            """Send an update to Asana in the background, so reviewing can carry on while it's in flight."""
 
-                def add_note():
-                    with ui.dialog() as dialog, ui.card().classes("w-96"):
-                        note_input = ui.input(
-                            "Enter note (adds date and initials)"
-                        ).classes("w-full")
-
-                        color_change = ui.dropdown_button(
-                            "Change color",
-                            auto_close=True,
-                        )
-                        color_to_become: None | str = None
-
-                        user_initials = client.config.get("initials")
-                        if user_initials == "AJP":
-                            color_to_become = "yellow"
-                            color_change.classes(get_button_style("yellow"))
-
-                        def set_color(color):
-                            nonlocal color_to_become
-                            color_change.classes(get_button_style(color))
-                            color_to_become = color
-
-                        with color_change:
-                            for color in client.colors:
-                                ui.item(
-                                    color.capitalize(),
-                                    on_click=lambda c=color: set_color(c),
-                                )
+            async def send():
+                result = await update
+                with review_card:
+                    ui.notify(
+                        result
+                        or f"Couldn't update {project['name']}, try again shortly."
+                    )
+                # The cached project has the new note now, show it if it's still the one on screen
+                if filtered_projects[current_index] is project:
+                    show_current_project()
+
+            background_tasks.create(send())
+
+        # The note and hold dialogs are built once and reset each time they're opened for the current project
+        note_project: dict = {}
+        color_to_become: None | str = None
+        color_classes = ""
+
+        def set_color(color: str | None):
+            nonlocal color_to_become, color_classes
+            new_classes = client.button_classes([color]) if color else ""
+            color_change.classes(remove=color_classes, add=new_classes)
+            color_classes = new_classes
+            color_to_become = color
+
+        def submit_note():
+            if note_input.value:
+                # The color is changed in the same update as the note
+                send_update(
+                    note_project,
+                    client.add_note(
+                        note_input.value, note_project["gid"], color_to_become
+                    ),
+                )
+                note_dialog.close()
 
-                        def submit():
-                            if note_input.value:
-                                client.add_note(note_input.value, project["gid"])
-                                if color_to_become:
-                                    client.change_color(color_to_become, project["gid"])
-                                dialog.close()
+        with ui.dialog() as note_dialog, ui.card().classes("w-96"):
+            note_input = ui.input("Enter note (adds date and initials)").classes(
+                "w-full"
+            )
 
-                        with ui.row():
-                            ui.button("Submit", on_click=submit)
-                            ui.button("Cancel", on_click=dialog.close)
-                    dialog.open()
+            color_change = ui.dropdown_button(
+                "Change color",
+                auto_close=True,
+            )
+            with color_change:
+                for color in client.colors:
+                    ui.item(
+                        color.capitalize(),
+                        on_click=lambda c=color: set_color(c),
+                    )
 
-                def add_hold():
-                    with ui.dialog() as dialog, ui.card().classes("w-96"):
-                        hold_input = (
-                            ui.date(mask="MM/DD/YY")
-                            .classes("w-full")
-                            .props(
-                                ':options="date => { const today = new Date(); today.setHours(0,0,0,0); return new Date(date) > today; }"'
-                            )
-                        )
+            with ui.row():
+                ui.button("Submit", on_click=submit_note)
+                ui.button("Cancel", on_click=note_dialog.close)
+
+        def add_note():
+            nonlocal note_project
+            note_project = filtered_projects[current_index]
+            note_input.set_value("")
+            set_color("yellow" if client.config.get("initials") == "AJP" else None)
+            note_dialog.open()
+
+        hold_project: dict = {}
+
+        def submit_hold():
+            if hold_input.value:
+                send_update(
+                    hold_project,
+                    client.add_note(f"hold {hold_input.value}", hold_project["gid"]),
+                )
+                hold_dialog.close()
+                go_next()
+
+        with ui.dialog() as hold_dialog, ui.card().classes("w-96"):
+            hold_input = (
+                ui.date(mask="MM/DD/YY")
+                .classes("w-full")
+                .props(
+                    ':options="date => { const today = new Date(); today.setHours(0,0,0,0); return new Date(date) > today; }"'
+                )
+            )
 
-                        def submit():
-                            if hold_input.value:
-                                client.add_note(
-                                    f"hold {hold_input.value}",
-                                    project["gid"],
-                                )
-                                dialog.close()
-                                go_next()
+            with ui.row():
+                ui.button("Submit", on_click=submit_hold)
+                ui.button("Cancel", on_click=hold_dialog.close)
 
-                        with ui.row():
-                            ui.button("Submit", on_click=submit)
-                            ui.button("Cancel", on_click=dialog.close)
-                    dialog.open()
+        def add_hold():
+            nonlocal hold_project
+            hold_project = filtered_projects[current_index]
+            hold_input.set_value(None)
+            hold_dialog.open()
 
-                if current_index >= len(filtered_projects):
-                    ui.label("No more projects to review!").classes("text-xl")
-                    return
+        def go_previous():
+            nonlocal current_index
+            if current_index > 0:
+                current_index -= 1
+                show_current_project()
 
-                project = filtered_projects[current_index]
+        def go_next():
+            nonlocal current_index
+            if current_index < project_count - 1:
+                current_index += 1
+                show_current_project()
 
-                ui.label(
-                    f"Project {current_index + 1} of {len(filtered_projects)}"
-                ).classes("text-sm text-gray-500")
-                ui.label(project["name"]).classes("text-xl font-bold")
+        # The card is built once, and only its text and buttons change when moving between projects
+        with ui.card().classes("w-full max-w-2xl mx-auto p-4") as review_card:
+            index_label = ui.label().classes("text-sm text-gray-500")
+            name_label = ui.label().classes("text-xl font-bold")
 
-                with ui.row():
-                    ui.button(
-                        "Open in Asana",
-                        on_click=lambda: ui.navigate.to(
-                            project["permalink_url"], new_tab=True
-                        ),
-                    )
+            with ui.row():
+                ui.button(
+                    "Open in Asana",
+                    on_click=lambda: ui.navigate.to(
+                        filtered_projects[current_index]["permalink_url"],
+                        new_tab=True,
+                    ),
+                )
 
-                    ui.button(
-                        "Add note",
-                        on_click=add_note,
-                    )
+                ui.button(
+                    "Add note",
+                    on_click=add_note,
+                )
 
-                    ui.button(
-                        "Hold",
-                        on_click=add_hold,
-                    )
+                ui.button(
+                    "Hold",
+                    on_click=add_hold,
+                )
 
-                with ui.row().classes("w-full justify-between mt-4"):
+            with ui.row().classes("w-full justify-between mt-4"):
+                prev_button = ui.button("Previous", on_click=go_previous).props(
+                    "icon=arrow_back"
+                )
 
-                    def go_previous():
-                        nonlocal current_index
-                        current_index = max(0, current_index - 1)
-                        show_current_project.refresh()
+                next_button = ui.button(
+                    "Skip/Next",
+                    on_click=go_next,
+                ).props("icon=arrow_forward")
 
-                    def go_next():
-                        nonlocal current_index
-                        current_index = min(
-                            len(filtered_projects) - 1, current_index + 1
-                        )
-                        show_current_project.refresh()
+            notes_heading = ui.label("Notes:").classes("font-bold")
+            notes_label = ui.label().classes("whitespace-pre-wrap")
 
-                    prev_button = ui.button("Previous", on_click=go_previous).props(
-                        "icon=arrow_back"
+        def show_current_project():
+            """Update the card to show the project at current_index."""
+            project = filtered_projects[current_index]
+
+            # Show the cached project straight away, then again once it's been refreshed if it's still on screen.
+            # The next couple are refreshed meanwhile, so they're usually current by the time they're shown.
+            refresh = client.prefetch_project(project["gid"])
+            if not refresh.done():
+                refresh.add_done_callback(
+                    lambda _: (
+                        filtered_projects[current_index] is project
+                        and show_current_project()
                     )
-
-                    next_button = ui.button(
-                        "Skip/Next",
-                        on_click=go_next,
-                    ).props("icon=arrow_forward")
-
-                    if current_index <= 0:
-                        prev_button.disable()
-                    if current_index >= len(filtered_projects) - 1:
-                        next_button.disable()
-
-                if project.get("notes"):
-                    ui.label("Notes:").classes("font-bold")
-                    ui.label(project["notes"].strip()).classes("whitespace-pre-wrap")
+                )
+            for upcoming in filtered_projects[current_index + 1 : current_index + 3]:
+                client.prefetch_project(upcoming["gid"])
+            index_label.set_text(f"Project {current_index + 1} of {project_count}")
+            name_label.set_text(project["name"])
+            prev_button.set_enabled(current_index > 0)
+            next_button.set_enabled(current_index < project_count - 1)
+
+            notes = project.get("notes")
+            notes_heading.set_visibility(bool(notes))
+            notes_label.set_visibility(bool(notes))
+            notes_label.set_text(notes.strip() if notes else "")
 
         show_current_project()
 
@@ -1014,7 +2062,11 @@ def create_app():
         title="Asana Tool",
         window_size=(1200, 800) if ON_WINDOWS else None,
         port=native.find_open_port(),
+        # Nothing uses bindings, so don't poll for them as often as the default 0.1 seconds
+        binding_refresh_interval=0.5,
     )
 
 
-create_app()
+# NiceGUI runs the script again as __mp_main__ in its reload and native processes, so that must start the app too
+if __name__ in {"__main__", "__mp_main__"}:
+    create_app()